@@ -9,6 +9,7 @@ This script automates the download process for Common Voice datasets by:
 4. Optionally extracting archives
 
 Requires the suitable Chromedriver for your platform in the $PATH or in the same directory as this script.
+If `pigz` is available in the $PATH it is used to decompress archives, otherwise Python's tarfile is used.
 
 Usage:
     python common_voice_downloader.py --download_path /path/to/store/datasets
@@ -16,30 +17,83 @@ Usage:
 Optional arguments:
     --file FILE          Path to a JSON file containing dataset entries (skip scraping and start downloading files)
     --warnsize           Warn about uncompressed .tar.gz size (gives an estimate of size of downloaded corpus)
-    --untar              Automatically extract downloaded .tar.gz files
+    --untar              Automatically extract downloaded .tar.gz files (temporarily needs up to twice
+                         the uncompressed size of free space, otherwise archives are streamed)
+    --concurrency N      Number of simultaneous downloads (default: 8)
 """
 
 import argparse
 import concurrent.futures
+import contextlib
+import gzip
 import json
+import os
 import re
+import shutil
+import subprocess
 import tarfile
-import time
+import threading
 from pathlib import Path
-from typing import Dict, Optional, Tuple
-from urllib.parse import urlparse
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urljoin, urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
+from selenium.common.exceptions import StaleElementReferenceException
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select, WebDriverWait
 from tqdm import tqdm
+from urllib3.util.retry import Retry
 from webdriver_manager.chrome import ChromeDriverManager
 
 
+def create_session(pool_size: int = 8) -> requests.Session:
+    """Create a requests session with pooled, keep-alive HTTPS connections.
+
+    Reusing one session lets successive requests share keep-alive connections and
+    avoids a fresh TCP/TLS handshake for every request made by the download workers.
+
+    Args:
+        pool_size: Maximum number of connections kept alive per host
+
+    Returns:
+        A configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504]),
+    )
+    session.mount("https://", adapter)
+    return session
+
+
+# Read size used when streaming downloads to disk.
+DOWNLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+
+
+class _ProgressWriter:
+    """File wrapper that advances a tqdm progress bar on every write.
+
+    Lets shutil.copyfileobj drive the progress bar once per chunk without a
+    Python-level read/write loop.
+    """
+
+    def __init__(self, file_out: BinaryIO, progress_bar: tqdm) -> None:
+        self._file_out = file_out
+        self._progress_bar = progress_bar
+
+    def write(self, data: bytes) -> int:
+        written = self._file_out.write(data)
+        self._progress_bar.update(len(data))
+        return written
+
+
 def parse_size(text: str) -> Tuple[float, Optional[str]]:
     """Parse a size string into numeric value and unit.
 
@@ -80,53 +134,397 @@ def to_megabytes(size_value: float, size_unit: Optional[str]) -> float:
     return size_value
 
 
-def warn_uncompressed_size(download_dir: Path) -> None:
-    """Scan all .tar.gz files and warn about total uncompressed size.
+@contextlib.contextmanager
+def _open_tar_stream(archive: Path) -> Iterator[tarfile.TarFile]:
+    """Open a .tar.gz archive for sequential reading.
+
+    Decompression is handed to `pigz` when it is installed, leaving only the tar
+    header parsing to Python.
+
+    Args:
+        archive: Path to the .tar.gz archive
+
+    Yields:
+        A TarFile opened in streaming mode
+    """
+    pigz = shutil.which("pigz")
+    if pigz is None:
+        with tarfile.open(archive, "r|gz") as tar:
+            yield tar
+        return
+
+    with subprocess.Popen([pigz, "-dc", str(archive)], stdout=subprocess.PIPE) as proc:
+        with tarfile.open(fileobj=proc.stdout, mode="r|") as tar:
+            yield tar
+        # Drain any padding after the end-of-archive marker so pigz can exit cleanly
+        while proc.stdout.read(DOWNLOAD_CHUNK_SIZE):
+            pass
+        proc.wait()
+
+    # tarfile treats a truncated archive ending on a block boundary as a normal EOF,
+    # so rely on pigz to report corrupt or truncated input
+    if proc.returncode:
+        raise tarfile.TarError(f"pigz exited with status {proc.returncode} for {archive}")
+
+
+def _archive_uncompressed_size(archive: Path) -> int:
+    """Sum the sizes of the members of a .tar.gz archive without extracting it.
+
+    Args:
+        archive: Path to the .tar.gz archive
+
+    Returns:
+        The total uncompressed size in bytes of the archive's members
+    """
+    # Stream the archive rather than building the full member list in memory
+    archive_bytes = 0
+    with _open_tar_stream(archive) as tar:
+        for member in tar:
+            archive_bytes += member.size
+            tar.members.clear()
+    return archive_bytes
+
+
+def _decompress_archive(archive: Path, tar_path: Path) -> None:
+    """Decompress a .tar.gz archive to a plain, seekable .tar file.
+
+    Uses `pigz` when it is installed, otherwise Python's gzip module.
+
+    Args:
+        archive: Path to the .tar.gz archive
+        tar_path: Path to write the decompressed .tar file to
+
+    Raises:
+        tarfile.TarError: If pigz exits with an error
+    """
+    pigz = shutil.which("pigz")
+    with tar_path.open("wb") as tar_out:
+        if pigz is None:
+            with gzip.open(archive, "rb") as gz_in:
+                shutil.copyfileobj(gz_in, tar_out, length=DOWNLOAD_CHUNK_SIZE)
+            return
+
+        returncode = subprocess.run([pigz, "-dc", str(archive)], stdout=tar_out).returncode
+    if returncode:
+        raise tarfile.TarError(f"pigz exited with status {returncode} for {archive}")
+
+
+def _extract_member_data(tar_fd: int, offset: int, size: int, target: Path) -> None:
+    """Copy one regular file's data out of a plain .tar file.
+
+    Args:
+        tar_fd: Open file descriptor of the .tar file, shared between threads
+        offset: Offset of the member's data within the .tar file
+        size: Size of the member's data in bytes
+        target: Path to write the member to
+    """
+    with target.open("wb") as file_out:
+        position = offset
+        remaining = size
+        while remaining:
+            data = os.pread(tar_fd, min(DOWNLOAD_CHUNK_SIZE, remaining), position)
+            if not data:
+                raise tarfile.ReadError(f"Unexpected end of data while extracting {target}")
+            file_out.write(data)
+            position += len(data)
+            remaining -= len(data)
+
+
+def _check_member(member: tarfile.TarInfo, dest: Path) -> tarfile.TarInfo:
+    """Check that a tar member is safe to extract into a directory.
+
+    Uses tarfile's "data" extraction filter where available. On older Pythons without
+    it, rejects members (and link targets) that would resolve outside dest.
+
+    Args:
+        member: The tar member to check
+        dest: Directory the archive is being extracted into
+
+    Returns:
+        The member to extract, with any unsafe attributes removed
+
+    Raises:
+        tarfile.TarError: If the member would be written outside dest
+    """
+    if hasattr(tarfile, "data_filter"):
+        return tarfile.data_filter(member, str(dest))
+
+    dest_real = os.path.realpath(dest)
+    paths = [os.path.join(dest_real, member.name)]
+    if member.issym():
+        paths.append(os.path.join(dest_real, os.path.dirname(member.name), member.linkname))
+    elif member.islnk():
+        paths.append(os.path.join(dest_real, member.linkname))
+    for path in paths:
+        if os.path.commonpath([dest_real, os.path.realpath(path)]) != dest_real:
+            raise tarfile.TarError(f"Refusing to extract {member.name!r} outside {dest}")
+    return member
+
+
+def _extract_plain_tar(tar_path: Path, dest: Path, workers: int = 8) -> int:
+    """Extract a plain .tar file, copying regular files out in parallel.
+
+    An uncompressed tar is seekable, so once the member offsets are known each file
+    can be read independently. Common Voice archives hold many small clips, which
+    benefit from having several writes in flight at once.
+
+    Args:
+        tar_path: Path to the plain .tar file
+        dest: Directory to extract the archive into
+        workers: Number of threads used to write regular files
+
+    Returns:
+        The total size in bytes of the archive's members
+    """
+    total_bytes = 0
+    # Keyed by target path so that, as with tar itself, the last copy of a
+    # repeated member name is the one extracted
+    regular_files: Dict[Path, Tuple[int, int, Optional[int], int]] = {}
+    other_members: Dict[Path, tarfile.TarInfo] = {}
+    directories: Dict[Path, Tuple[Optional[int], int]] = {}
+
+    with tarfile.open(tar_path, "r:") as tar:
+        # Keep only a small tuple for each regular file rather than its full TarInfo.
+        # Every member is checked before anything is written.
+        for member in tar:
+            total_bytes += member.size
+            checked = _check_member(member, dest)
+            target = dest / checked.name
+            if member.isreg():
+                other_members.pop(target, None)
+                regular_files[target] = (
+                    member.offset_data,
+                    member.size,
+                    checked.mode,
+                    int(checked.mtime),
+                )
+            elif member.isdir():
+                directories[target] = (checked.mode, int(checked.mtime))
+            else:
+                regular_files.pop(target, None)
+                other_members[target] = member
+            tar.members.clear()
+
+        for directory in directories:
+            directory.mkdir(parents=True, exist_ok=True)
+        for parent in {target.parent for target in regular_files}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        tar_fd = os.open(tar_path, os.O_RDONLY)
+        try:
+            with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [
+                    executor.submit(_extract_member_data, tar_fd, offset, size, target)
+                    for target, (offset, size, _, _) in regular_files.items()
+                ]
+                for future in concurrent.futures.as_completed(futures):
+                    future.result()
+        finally:
+            os.close(tar_fd)
+
+        for target, (_, _, mode, mtime) in regular_files.items():
+            if mode is not None:
+                os.chmod(target, mode)
+            os.utime(target, (mtime, mtime))
+
+        # Links and special files are rare, leave them to tarfile
+        extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+        for member in other_members.values():
+            tar.extract(member, path=dest, **extract_kwargs)
+
+        # Set directory attributes last, deepest first, as extracting into a directory
+        # updates its mtime
+        for directory in sorted(directories, key=lambda path: len(path.parts), reverse=True):
+            mode, mtime = directories[directory]
+            if mode is not None:
+                os.chmod(directory, mode)
+            os.utime(directory, (mtime, mtime))
+
+    return total_bytes
+
+
+def _extract_streaming(archive: Path, dest: Path) -> int:
+    """Extract a .tar.gz archive member by member as it is decompressed.
+
+    Slower than extracting from a plain .tar file, but needs no temporary disk space.
+
+    Args:
+        archive: Path to the .tar.gz archive
+        dest: Directory to extract the archive into
+
+    Returns:
+        The total size in bytes of the archive's members
+    """
+    total_bytes = 0
+    extract_kwargs = {"filter": "data"} if hasattr(tarfile, "data_filter") else {}
+    with _open_tar_stream(archive) as tar:
+        for member in tar:
+            total_bytes += member.size
+            _check_member(member, dest)
+            tar.extract(member, path=dest, **extract_kwargs)
+            tar.members.clear()
+    return total_bytes
+
+
+def _estimate_uncompressed_size(archive: Path) -> int:
+    """Estimate the uncompressed size of a .tar.gz archive without decompressing it.
+
+    The gzip trailer stores the uncompressed size modulo 2**32, so the estimate is the
+    smallest such value that is at least the compressed size. Common Voice audio barely
+    compresses, so this is close in practice.
+
+    Args:
+        archive: Path to the .tar.gz archive
+
+    Returns:
+        The estimated uncompressed size in bytes
+    """
+    compressed_size = archive.stat().st_size
+    if compressed_size < 4:
+        return compressed_size
+    with archive.open("rb") as fptr:
+        fptr.seek(-4, os.SEEK_END)
+        size = int.from_bytes(fptr.read(4), "little")
+    while size < compressed_size:
+        size += 1 << 32
+    return size
+
+
+def _plan_temp_tar_extraction(archives: List[Path]) -> Dict[Path, bool]:
+    """Decide which archives have enough free space to go through a temporary .tar file.
+
+    Extracting via a plain .tar file needs room for the extracted files and the
+    temporary .tar at the same time. Space for every archive's extracted files is
+    reserved first, then archives are given a temporary .tar while space remains,
+    assuming they are all extracted at once.
+
+    Args:
+        archives: Paths to the .tar.gz archives to be extracted
+
+    Returns:
+        Dictionary mapping each archive to whether it should use a temporary .tar file
+    """
+    estimates = {archive: _estimate_uncompressed_size(archive) for archive in archives}
+
+    free_space: Dict[int, int] = {}
+    for archive in archives:
+        device = archive.parent.stat().st_dev
+        if device not in free_space:
+            free_space[device] = shutil.disk_usage(archive.parent).free
+        free_space[device] -= estimates[archive]
+
+    use_temp_tar: Dict[Path, bool] = {}
+    for archive in archives:
+        device = archive.parent.stat().st_dev
+        use_temp_tar[archive] = free_space[device] >= estimates[archive]
+        if use_temp_tar[archive]:
+            free_space[device] -= estimates[archive]
+    return use_temp_tar
+
+
+def _extract_one(archive: Path, use_temp_tar: bool = True) -> int:
+    """Extract a single .tar.gz archive into a folder alongside it.
+
+    By default the archive is first decompressed to a temporary plain .tar file next to
+    it, which is removed once extraction finishes. This needs free space for the
+    uncompressed archive on top of the extracted files.
+
+    Args:
+        archive: Path to the .tar.gz archive
+        use_temp_tar: Decompress to a temporary .tar file and extract files in parallel,
+            rather than extracting directly from the compressed stream
+
+    Returns:
+        The total uncompressed size in bytes of the archive's members
+    """
+    extract_folder = archive.parent / archive.stem
+    extract_folder.mkdir(parents=True, exist_ok=True)
+
+    if not use_temp_tar:
+        return _extract_streaming(archive, extract_folder)
+
+    tar_path = archive.with_name(f"{archive.stem}.partial")
+    try:
+        _decompress_archive(archive, tar_path)
+        return _extract_plain_tar(tar_path, extract_folder)
+    finally:
+        tar_path.unlink(missing_ok=True)
+
+
+def _process_archives(download_dir: Path, *, warn: bool, extract: bool) -> None:
+    """Extract and/or size all .tar.gz files under the download directory.
+
+    Each archive is decompressed at most once. When extracting, the uncompressed size is
+    taken from the extraction itself rather than from a separate scan of the archive.
+    Archives are extracted in separate processes, as gzip decompression is CPU bound.
 
     Args:
         download_dir: Directory containing the downloaded archives
+        warn: Warn about the total uncompressed size of the archives
+        extract: Extract each archive into a folder alongside it
     """
     archives = list(download_dir.rglob("*.tar.gz"))
     total_uncompressed_bytes = 0
 
-    print("Analyzing .tar.gz archives for uncompressed size...")
-    for archive in tqdm(archives, desc="Analyzing archives", unit="archive"):
-        try:
-            with tarfile.open(archive, "r:gz") as tar:
-                total_uncompressed_bytes += sum(member.size for member in tar.getmembers())
-        except (tarfile.TarError, OSError) as e:
-            print(f"Skipping {archive} due to read error: {e}")
-
-    total_uncompressed_mb = total_uncompressed_bytes / (1024 * 1024)
-    print(
-        f"\nWARNING: Potential total uncompressed size is approximately "
-        f"{total_uncompressed_mb:.2f} MB ({total_uncompressed_mb / 1024:.2f} GB)."
-    )
+    if extract and archives:
+        print("Extracting .tar.gz archives...")
+        use_temp_tar = _plan_temp_tar_extraction(archives)
+        for archive in archives:
+            if not use_temp_tar[archive]:
+                print(
+                    f"Not enough free space to decompress {archive.name} to a temporary file, "
+                    f"extracting it as a stream instead."
+                )
 
+        max_workers = min(os.cpu_count() or 1, len(archives))
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            future_to_archive = {
+                executor.submit(_extract_one, archive, use_temp_tar[archive]): archive
+                for archive in archives
+            }
+            for future in tqdm(
+                concurrent.futures.as_completed(future_to_archive),
+                total=len(archives),
+                desc="Archives",
+                unit="archive",
+            ):
+                archive = future_to_archive[future]
+                try:
+                    total_uncompressed_bytes += future.result()
+                except (tarfile.TarError, OSError) as e:
+                    print(f"Failed to extract {archive}: {e}")
+    elif warn:
+        print("Analyzing .tar.gz archives for uncompressed size...")
+        for archive in tqdm(archives, desc="Analyzing archives", unit="archive"):
+            try:
+                total_uncompressed_bytes += _archive_uncompressed_size(archive)
+            except (tarfile.TarError, OSError) as e:
+                print(f"Skipping {archive} due to read error: {e}")
+
+    if warn:
+        total_uncompressed_mb = total_uncompressed_bytes / (1024 * 1024)
+        print(
+            f"\nWARNING: Potential total uncompressed size is approximately "
+            f"{total_uncompressed_mb:.2f} MB ({total_uncompressed_mb / 1024:.2f} GB)."
+        )
 
-def untar_datasets(download_dir: Path) -> None:
-    """Extract all .tar.gz files under the download directory.
+
+def warn_uncompressed_size(download_dir: Path) -> None:
+    """Scan all .tar.gz files and warn about total uncompressed size.
 
     Args:
         download_dir: Directory containing the downloaded archives
     """
-    archives = list(download_dir.rglob("*.tar.gz"))
+    _process_archives(download_dir, warn=True, extract=False)
 
-    print("Extracting .tar.gz archives...")
-    for archive in tqdm(archives, desc="Archives", unit="archive"):
-        extract_folder = archive.parent / archive.stem
-        extract_folder.mkdir(parents=True, exist_ok=True)
 
-        try:
-            with tarfile.open(archive, "r:gz") as tar:
-                members = tar.getmembers()
-                for member in tqdm(
-                    members, desc=f"Extracting {archive.name}", leave=False, unit="file"
-                ):
-                    tar.extract(member, path=extract_folder)
+def untar_datasets(download_dir: Path) -> None:
+    """Extract all .tar.gz files under the download directory.
 
-        except (tarfile.TarError, OSError) as e:
-            print(f"Failed to extract {archive}: {e}")
+    Args:
+        download_dir: Directory containing the downloaded archives
+    """
+    _process_archives(download_dir, warn=False, extract=True)
 
 
 def save_urls_json(
@@ -162,11 +560,140 @@ def load_urls_json(file_path: Path) -> Dict[str, Dict[str, str]]:
     return dataset_url_and_filenames
 
 
+def _scrape_dataset_link(
+    wait: WebDriverWait,
+    language_selector: Select,
+    dataset_language_code: str,
+    email: str,
+    common_voice_version: float,
+) -> Tuple[str, float]:
+    """Fill in the download form for one language and read back its download link.
+
+    Args:
+        wait: WebDriverWait bound to the driver showing the datasets page
+        language_selector: The language <select> element on the datasets page
+        dataset_language_code: Locale code of the language to select
+        email: Email address used for authentication with Common Voice
+        common_voice_version: Version number of Common Voice to download
+
+    Returns:
+        A tuple containing the dataset download URL and its size in megabytes
+    """
+    language_selector.select_by_value(dataset_language_code)
+    table = wait.until(
+        EC.visibility_of_element_located(
+            (By.CSS_SELECTOR, "table.table.dataset-table.hidden-md-down")
+        )
+    )
+
+    rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
+    for row in rows:
+        cells = row.find_elements(By.TAG_NAME, "td")
+        version_text = cells[0].text
+        if version_text == f"Common Voice Corpus {common_voice_version}":
+            row.click()
+            break
+
+    email_input = wait.until(
+        EC.visibility_of_element_located((By.CSS_SELECTOR, "input[name='email']"))
+    )
+    email_input.clear()
+    email_input.send_keys(email)
+
+    checkbox_size = wait.until(EC.element_to_be_clickable((By.NAME, "confirmSize")))
+    download_size_text = checkbox_size.accessible_name
+    size_value, size_unit = parse_size(download_size_text)
+    if not checkbox_size.is_selected():
+        checkbox_size.click()
+
+    checkbox_no_identify = wait.until(EC.element_to_be_clickable((By.NAME, "confirmNoIdentify")))
+    if not checkbox_no_identify.is_selected():
+        checkbox_no_identify.click()
+
+    wait.until(
+        EC.element_to_be_clickable((By.CSS_SELECTOR, "a.download-language.button.rounded"))
+    )
+    # The previous language's link can still be on the page until the form re-renders,
+    # so wait for a link to this language's archive
+    dataset_url = wait.until(_download_link_for_locale(dataset_language_code))
+    return dataset_url, to_megabytes(size_value, size_unit)
+
+
+def _download_link_for_locale(dataset_language_code: str) -> Callable[[Any], Optional[str]]:
+    """Build a WebDriverWait condition for the download link of a given language.
+
+    Args:
+        dataset_language_code: Locale code of the selected language
+
+    Returns:
+        A condition returning the link's href once it points at the language's archive
+    """
+    suffix = f"-{dataset_language_code}.tar.gz"
+
+    def condition(driver) -> Optional[str]:
+        try:
+            link = driver.find_element(By.CSS_SELECTOR, "a.download-language.button.rounded")
+            href = link.get_attribute("href")
+        except StaleElementReferenceException:
+            return None
+        if href and urlparse(href).path.endswith(suffix):
+            return href
+        return None
+
+    return condition
+
+
+def _build_dataset_url(template_url: str, template_code: str, locale: str) -> Optional[str]:
+    """Build the download URL for a locale from another locale's download URL.
+
+    Archive names follow the pattern cv-corpus-<version>-<date>-<locale>.tar.gz, so
+    the URL for any locale can be derived from a single scraped link.
+
+    Args:
+        template_url: A download URL scraped from the datasets page
+        template_code: Locale code the template URL was scraped for
+        locale: Locale code to build the URL for
+
+    Returns:
+        The derived URL, or None if the template does not follow the expected pattern
+    """
+    template_filename = Path(urlparse(template_url).path).name
+    suffix = f"-{template_code}.tar.gz"
+    if not template_filename.endswith(suffix):
+        return None
+    filename = f"{template_filename[: -len(suffix)]}-{locale}.tar.gz"
+    return urljoin(template_url, filename)
+
+
+def _probe_dataset_url(session: requests.Session, url: str) -> Optional[float]:
+    """Check that a derived download URL exists.
+
+    Args:
+        session: Session to issue the HEAD request with
+        url: The download URL to check
+
+    Returns:
+        The size of the remote file in megabytes, or None if it is not available
+    """
+    try:
+        response = session.head(url, allow_redirects=True)
+    except requests.RequestException as e:
+        print(f"Error retrieving HEAD for {url}: {e}")
+        return None
+    if response.status_code != 200:
+        return None
+    return int(response.headers.get("content-length", 0)) / (1024 * 1024)
+
+
 def get_datasets_to_download(
     download_dir: Path, email: str, datasets_url: str, common_voice_version: float
 ) -> Dict[str, Dict[str, str]]:
     """Scrape Common Voice website to collect dataset download links.
 
+    The download form is only filled in for the first language. The remaining URLs are
+    derived from that link and checked with a HEAD request. If a derived URL is not
+    available, the form is used for that and every remaining language.
+
     Args:
         download_dir: Directory where the dataset information will be saved
         email: Email address used for authentication with Common Voice
@@ -182,6 +709,7 @@ def get_datasets_to_download(
         options=chrome_options, service=ChromeService(ChromeDriverManager().install())
     )
     wait = WebDriverWait(driver, 30)
+    session = create_session()
 
     total_mb: float = 0.0
     dataset_url_and_filenames: Dict[str, Dict[str, str]] = {}
@@ -193,54 +721,34 @@ def get_datasets_to_download(
             EC.presence_of_element_located((By.CSS_SELECTOR, "select[name='bundleLocale']"))
         )
         language_selector = Select(select_element)
+        languages = [
+            (option.get_attribute("value"), option.text) for option in language_selector.options
+        ]
 
-        for option in language_selector.options:
-            dataset_language_code = option.get_attribute("value")
-            dataset_language = option.text
+        template: Optional[Tuple[str, str]] = None
+        derive_urls = True
+        for dataset_language_code, dataset_language in languages:
             print(f"Language: {dataset_language}")
 
-            language_selector.select_by_value(dataset_language_code)
-            table = wait.until(
-                EC.visibility_of_element_located(
-                    (By.CSS_SELECTOR, "table.table.dataset-table.hidden-md-down")
+            dataset_url = None
+            if template is not None and derive_urls:
+                dataset_url = _build_dataset_url(*template, dataset_language_code)
+                size_mb = _probe_dataset_url(session, dataset_url) if dataset_url else None
+                if size_mb is None:
+                    # Derived URLs do not work for this release (e.g. the form hands out
+                    # signed links), so use the form for every remaining language
+                    print("Derived download URL not available, using the download form instead.")
+                    derive_urls = False
+                    dataset_url = None
+
+            if dataset_url is None:
+                dataset_url, size_mb = _scrape_dataset_link(
+                    wait, language_selector, dataset_language_code, email, common_voice_version
                 )
-            )
-
-            rows = table.find_elements(By.CSS_SELECTOR, "tbody tr")
-            for row in rows:
-                cells = row.find_elements(By.TAG_NAME, "td")
-                version_text = cells[0].text
-                if version_text == f"Common Voice Corpus {common_voice_version}":
-                    row.click()
-                    break
-
-            time.sleep(2)
-
-            email_input = wait.until(
-                EC.visibility_of_element_located((By.CSS_SELECTOR, "input[name='email']"))
-            )
-            email_input.clear()
-            email_input.send_keys(email)
-
-            checkbox_size = wait.until(EC.element_to_be_clickable((By.NAME, "confirmSize")))
-            download_size_text = checkbox_size.accessible_name
-            size_value, size_unit = parse_size(download_size_text)
-            total_mb += to_megabytes(size_value, size_unit)
-            if not checkbox_size.is_selected():
-                checkbox_size.click()
-
-            checkbox_no_identify = wait.until(
-                EC.element_to_be_clickable((By.NAME, "confirmNoIdentify"))
-            )
-            if not checkbox_no_identify.is_selected():
-                checkbox_no_identify.click()
-
-            time.sleep(1)
-
-            download_link_button = wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, "a.download-language.button.rounded"))
-            )
-            dataset_url = download_link_button.get_attribute("href")
+                if template is None:
+                    template = (dataset_url, dataset_language_code)
+
+            total_mb += size_mb
 
             parsed_url = urlparse(dataset_url)
             filename = Path(parsed_url.path).name
@@ -277,82 +785,169 @@ def create_dataset_directories(
         dataset_url_and_filenames[dataset_language]["download_filepath"] = str(download_filepath)
 
 
-def _download_file(entry: Dict[str, str]) -> str:
+def _load_size_cache(cache_path: Path) -> Dict[str, Dict[str, Any]]:
+    """Load the remote size cache written by a previous run.
+
+    Args:
+        cache_path: Path to the JSON size cache file
+
+    Returns:
+        Dictionary mapping each URL to its cached "size", "etag" and "last_modified"
+    """
+    if not cache_path.is_file():
+        return {}
+    try:
+        with cache_path.open("r", encoding="utf-8") as fptr:
+            return json.load(fptr)
+    except (OSError, ValueError) as e:
+        print(f"Ignoring unreadable size cache {cache_path}: {e}")
+        return {}
+
+
+def _save_size_cache(cache_path: Path, size_cache: Dict[str, Dict[str, Any]]) -> None:
+    """Save the remote size cache so later runs can skip already complete files.
+
+    Args:
+        cache_path: Path to the JSON size cache file
+        size_cache: Dictionary mapping each URL to its cached remote file details
+    """
+    with cache_path.open("w", encoding="utf-8") as fptr:
+        json.dump(size_cache, fptr)
+
+
+def _parse_content_range_total(content_range: Optional[str]) -> Optional[int]:
+    """Get the complete file size from a Content-Range header.
+
+    Args:
+        content_range: Header value such as 'bytes 0-99/1234' or 'bytes */1234'
+
+    Returns:
+        The complete file size, or None if the header is missing or the size is unknown
+    """
+    if not content_range or "/" not in content_range:
+        return None
+    total = content_range.rsplit("/", 1)[1].strip()
+    return int(total) if total.isdigit() else None
+
+
+def _update_size_cache(
+    size_cache: Dict[str, Dict[str, Any]],
+    cache_lock: threading.Lock,
+    url: str,
+    remote_size: int,
+    response: requests.Response,
+) -> None:
+    """Record the remote size and validators of a file in the size cache.
+
+    Args:
+        size_cache: Remote file sizes from previous runs, updated in place
+        cache_lock: Lock guarding updates to size_cache
+        url: The remote URL of the file
+        remote_size: The complete size of the remote file in bytes
+        response: The response the file details were read from
+    """
+    with cache_lock:
+        size_cache[url] = {
+            "size": remote_size,
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+        }
+
+
+def _download_file(
+    entry: Dict[str, str],
+    session: requests.Session,
+    size_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    cache_lock: Optional[threading.Lock] = None,
+) -> str:
     """Download a single file with progress bar, supporting resume.
 
     Args:
         entry: Dictionary containing download information with keys:
               - "href": The remote URL to download
               - "download_filepath": The local file path as a string
+        session: Shared session whose connection pool is reused across downloads
+        size_cache: Remote file sizes from previous runs, updated in place
+        cache_lock: Lock guarding updates to size_cache
 
     Returns:
         The local file path where the file was saved
     """
     url = entry["href"]
     filepath = Path(entry["download_filepath"])
+    if size_cache is None:
+        size_cache = {}
+    if cache_lock is None:
+        cache_lock = threading.Lock()
+
+    # 0) Skip the request entirely if a previous run already saw the full file
+    with cache_lock:
+        cached = size_cache.get(url)
+    if cached and filepath.exists() and filepath.stat().st_size == cached["size"]:
+        print(f"{filepath} is already fully downloaded ({cached['size']} bytes). Skipping.")
+        return str(filepath)
+
+    local_size = filepath.stat().st_size if filepath.exists() else 0
+
+    # 1) A single ranged GET both reports the remote size and fetches whatever is missing
+    headers = {"Range": f"bytes={local_size}-"}
+    if cached and cached.get("etag"):
+        # Only resume if the remote file is unchanged, otherwise the server sends it all
+        headers["If-Range"] = cached["etag"]
 
-    # 1) HEAD request to get remote file size
     try:
-        head_resp = requests.head(url, allow_redirects=True)
-        head_resp.raise_for_status()
-        remote_size = int(head_resp.headers.get("content-length", 0))
-    except Exception as e:
-        print(f"Error retrieving HEAD for {url}: {e}")
-        remote_size = 0
-
-    # 2) Check if the file is already complete
-    if filepath.exists():
-        local_size = filepath.stat().st_size
-        if local_size == remote_size and remote_size > 0:
-            print(f"{filepath} is already fully downloaded ({local_size} bytes). Skipping.")
-            return str(filepath)
-    else:
-        local_size = 0
-
-    # 3) Decide whether to attempt partial resume
-    headers = {}
-    mode = "wb"  # default to write from scratch
-
-    if local_size > 0 and local_size < remote_size:
-        # Attempt a partial download
-        headers = {"Range": f"bytes={local_size}-"}
-        mode = "ab"  # append mode
+        response = session.get(url, stream=True, headers=headers)
+        if response.status_code == 416:
+            # Nothing left to send for the requested range
+            response.close()
+            remote_size = _parse_content_range_total(response.headers.get("content-range"))
+            if remote_size == local_size:
+                _update_size_cache(size_cache, cache_lock, url, remote_size, response)
+                print(f"{filepath} is already fully downloaded ({local_size} bytes). Skipping.")
+                return str(filepath)
+            if remote_size is None:
+                print(f"Unexpected status code {response.status_code} for {url}.")
+                return str(filepath)
+            # The local file does not match the remote one (e.g. it is larger than the
+            # remote file), so download the whole file again
+            response = session.get(url, stream=True)
 
-    # 4) Perform the actual GET request
-    try:
-        with requests.get(url, stream=True, headers=headers) as response:
+        with response:
             # If partial content is not supported, server might return 200 instead of 206
-            if response.status_code in (200, 206):
-                total_size_in_bytes = int(response.headers.get("content-length", 0))
-
-                # If we got 206, total_size_in_bytes should be how many bytes remain
-                # If 200, we assume the server doesn't support partial. Redownload everything
-                if response.status_code == 200:
-                    # Start from scratch
-                    local_size = 0
-                    mode = "wb"
-
-                # TQDM progress bar
-                # The total is remote_size if server 200, or the partial remainder if 206
-                if response.status_code == 206:
-                    total_download_bytes = local_size + total_size_in_bytes
-                else:
-                    total_download_bytes = total_size_in_bytes
-
-                print(f"Downloading {filepath} (resume={response.status_code == 206})")
-                with filepath.open(mode) as file_out, tqdm(
-                    total=total_download_bytes,
-                    initial=local_size if response.status_code == 206 else 0,
-                    unit="B",
-                    unit_scale=True,
-                    desc=f"Downloading {filepath.name}",
-                ) as progress_bar:
-                    for chunk in response.iter_content(chunk_size=1024 * 1024):
-                        if chunk:
-                            file_out.write(chunk)
-                            progress_bar.update(len(chunk))
+            if response.status_code == 206:
+                content_length = int(response.headers.get("content-length", 0))
+                remote_size = _parse_content_range_total(response.headers.get("content-range"))
+                if remote_size is None:
+                    remote_size = local_size + content_length
+                mode = "ab" if local_size > 0 else "wb"
+            elif response.status_code == 200:
+                # The server ignored the range, or the file changed. Redownload everything
+                remote_size = int(response.headers.get("content-length", 0))
+                local_size = 0
+                mode = "wb"
             else:
                 print(f"Unexpected status code {response.status_code} for {url}.")
+                return str(filepath)
+
+            if remote_size > 0:
+                _update_size_cache(size_cache, cache_lock, url, remote_size, response)
+
+            print(f"Downloading {filepath} (resume={mode == 'ab'})")
+            with filepath.open(mode) as file_out, tqdm(
+                total=remote_size,
+                initial=local_size,
+                unit="B",
+                unit_scale=True,
+                desc=f"Downloading {filepath.name}",
+            ) as progress_bar:
+                # Copy the raw stream in large chunks; decode_content keeps any
+                # transfer encoding handled the same way iter_content did.
+                response.raw.decode_content = True
+                shutil.copyfileobj(
+                    response.raw,
+                    _ProgressWriter(file_out, progress_bar),
+                    length=DOWNLOAD_CHUNK_SIZE,
+                )
     except Exception as exc:
         print(f"Error downloading {url}: {exc}")
 
@@ -360,17 +955,37 @@ def _download_file(entry: Dict[str, str]) -> str:
 
 
 def download_files(
-    dataset_url_and_filenames: Dict[str, Dict[str, str]], concurrency: int = 4
+    dataset_url_and_filenames: Dict[str, Dict[str, str]],
+    concurrency: int = 8,
+    size_cache_path: Optional[Path] = None,
+    session: Optional[requests.Session] = None,
 ) -> None:
     """Download multiple files in parallel with resume capability.
 
     Args:
         dataset_url_and_filenames: Dictionary with dataset download information
-        concurrency: Number of simultaneous downloads
+        concurrency: Maximum number of simultaneous downloads
+        size_cache_path: Optional JSON file used to remember remote file sizes between runs
+        session: Optional session to download with. By default a session whose connection
+            pool matches the number of download workers is created.
     """
     entries = list(dataset_url_and_filenames.values())
+    if not entries:
+        return
+    size_cache = _load_size_cache(size_cache_path) if size_cache_path else {}
+    cache_lock = threading.Lock()
+
+    # All archives live on the same CDN host, so size the per-host pool to the
+    # number of workers to avoid urllib3 discarding connections
+    concurrency = min(concurrency, len(entries))
+    if session is None:
+        session = create_session(pool_size=concurrency)
+
     with concurrent.futures.ThreadPoolExecutor(max_workers=concurrency) as executor:
-        future_to_entry = {executor.submit(_download_file, entry): entry for entry in entries}
+        future_to_entry = {
+            executor.submit(_download_file, entry, session, size_cache, cache_lock): entry
+            for entry in entries
+        }
         for future in concurrent.futures.as_completed(future_to_entry):
             entry = future_to_entry[future]
             try:
@@ -379,6 +994,31 @@ def download_files(
             except Exception as exc:
                 print(f"Error downloading {entry['href']}: {exc}")
 
+    if size_cache_path:
+        with cache_lock:
+            _save_size_cache(size_cache_path, size_cache)
+
+
+def _positive_int(value: str) -> int:
+    """Parse a command-line value that must be an integer of at least 1.
+
+    Args:
+        value: The raw command-line value
+
+    Returns:
+        The parsed integer
+
+    Raises:
+        argparse.ArgumentTypeError: If the value is not an integer of at least 1
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
 
 def parse_cmd_line_args():
     """Parse the command-line arguments.
@@ -410,7 +1050,17 @@ def parse_cmd_line_args():
     parser.add_argument(
         "--untar",
         action="store_true",
-        help="Automatically extract downloaded .tar.gz files.",
+        help=(
+            "Automatically extract downloaded .tar.gz files. Where free space allows, each "
+            "archive is first decompressed to a temporary .tar file next to it, which needs "
+            "up to twice the uncompressed size while extracting; otherwise it is streamed."
+        ),
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=_positive_int,
+        default=8,
+        help="Number of simultaneous downloads (default: 8).",
     )
     parser.add_argument(
         "--datasets_url",
@@ -451,13 +1101,17 @@ def main() -> None:
 
     create_dataset_directories(dataset_map, download_path)
 
-    download_files(dataset_map, concurrency=4)
+    download_files(
+        dataset_map,
+        concurrency=args.concurrency,
+        size_cache_path=download_path / ".size_cache.json",
+    )
 
-    if args.warnsize:
-        warn_uncompressed_size(download_path)
+    if args.warnsize or args.untar:
+        # Decompress each archive only once when both sizing and extracting
+        _process_archives(download_path, warn=args.warnsize, extract=args.untar)
 
     if args.untar:
-        untar_datasets(download_path)
         print("All archives extracted.")
 
 
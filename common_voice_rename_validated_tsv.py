@@ -25,10 +25,13 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
 import logging
 import shutil
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Set, Tuple
+
+from common_voice_utils import find_validated_tsvs
 
 
 def setup_logging(level: int = logging.INFO) -> logging.Logger:
@@ -55,7 +58,7 @@ def setup_logging(level: int = logging.INFO) -> logging.Logger:
 logger = setup_logging()
 
 
-def process_validated_tsvs(source_dir: Path, dest_dir: Path) -> None:
+def process_validated_tsvs(source_dir: Path, dest_dir: Path, max_workers: int = 16) -> None:
     """Recursively find 'validated.tsv' in source_dir, rename, and copy to dest_dir.
 
     Files are renamed to <LANGUAGE_NAME>_<LANGUAGE_CODE>_validated.tsv, where:
@@ -65,13 +68,14 @@ def process_validated_tsvs(source_dir: Path, dest_dir: Path) -> None:
     Args:
         source_dir: The root path containing language subdirectories.
         dest_dir: The path where the renamed TSV files will be copied.
+        max_workers: Maximum number of files to copy at the same time.
     """
     dest_dir.mkdir(parents=True, exist_ok=True)
 
     logger.info(f"Searching for validated.tsv files in {source_dir}")
 
     # Track all validated.tsv files found
-    found_files: List[Path] = list(source_dir.rglob("validated.tsv"))
+    found_files: List[Path] = list(find_validated_tsvs(source_dir))
 
     if not found_files:
         logger.warning(f"No validated.tsv files found in {source_dir}")
@@ -79,7 +83,9 @@ def process_validated_tsvs(source_dir: Path, dest_dir: Path) -> None:
 
     logger.info(f"Found {len(found_files)} validated.tsv files")
 
-    # Process each validated.tsv file
+    # Work out where each validated.tsv file should be copied to
+    copy_pairs: List[Tuple[Path, Path]] = []
+    planned_destinations: Set[Path] = set()
     for file_path in found_files:
         try:
             # Build a relative path from source_dir to the file
@@ -97,19 +103,31 @@ def process_validated_tsvs(source_dir: Path, dest_dir: Path) -> None:
             destination_path = dest_dir / new_filename
 
             # Check for duplicate names before copying
-            if destination_path.exists():
+            if destination_path in planned_destinations or destination_path.exists():
                 logger.warning(
                     f"Destination file {destination_path} already exists. " f"Skipping {file_path}"
                 )
                 continue
 
-            # Copy the file
-            shutil.copyfile(file_path, destination_path)
-            logger.info(f"Copied {file_path} -> {destination_path}")
+            planned_destinations.add(destination_path)
+            copy_pairs.append((file_path, destination_path))
 
         except Exception as e:
             logger.error(f"Error processing {file_path}: {e}")
 
+    # Copy the files concurrently so several copies are in flight on the disk at once
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        future_to_pair: Dict[concurrent.futures.Future, Tuple[Path, Path]] = {
+            executor.submit(shutil.copyfile, *pair): pair for pair in copy_pairs
+        }
+        for future in concurrent.futures.as_completed(future_to_pair):
+            file_path, destination_path = future_to_pair[future]
+            try:
+                future.result()
+                logger.info(f"Copied {file_path} -> {destination_path}")
+            except Exception as e:
+                logger.error(f"Error processing {file_path}: {e}")
+
 
 def parse_cmd_line_args():
     """Parse the command-line arguments.
@@ -0,0 +1,37 @@
+"""
+Shared helpers for the Common Voice utility scripts.
+"""
+
+import os
+from pathlib import Path
+from typing import Iterator, Union
+
+
+def find_validated_tsvs(root: Union[str, Path]) -> Iterator[Path]:
+    """Find every validated.tsv file below a directory.
+
+    Walks the tree with os.scandir and does not descend into 'clips' directories,
+    which hold the audio files and make up nearly all of a Common Voice dataset.
+    Directories that are missing or cannot be read are skipped.
+
+    Args:
+        root: Directory to search
+
+    Yields:
+        Path: Path to each validated.tsv file found
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        directory = stack.pop()
+        try:
+            entries = os.scandir(directory)
+        except OSError:
+            # Like Path.rglob, skip directories that are missing or cannot be read
+            continue
+        with entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name != "clips":
+                        stack.append(entry.path)
+                elif entry.name == "validated.tsv":
+                    yield Path(entry.path)
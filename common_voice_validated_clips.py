@@ -27,10 +27,13 @@ Example:
 
 import argparse
 import csv
+import logging
 import os
 import sys
 from pathlib import Path
 
+from common_voice_utils import find_validated_tsvs
+
 
 def parse_cmd_line_args() -> argparse.ArgumentParser:
     """Parse the command line arguments
@@ -57,14 +60,41 @@ def parse_cmd_line_args() -> argparse.ArgumentParser:
     return parser
 
 
+LOG_FILE_PATH = Path(__file__).resolve().parent / "create_symlinks.log"
+
+
 def get_log_file_path() -> Path:
     """Returns a path to the log file in the script's directory.
 
     Returns:
         Path: Path to the log file 'create_symlinks.log'
     """
-    script_dir = Path(__file__).resolve().parent
-    return script_dir / "create_symlinks.log"
+    return LOG_FILE_PATH
+
+
+def setup_logging(level: int = logging.INFO) -> logging.Logger:
+    """Configure a logger that appends to the log file.
+
+    The file is opened once and kept open, rather than reopened for every message.
+
+    Args:
+        level: The logging level to use. Defaults to logging.INFO.
+
+    Returns:
+        logging.Logger: Configured logger.
+    """
+    logger = logging.getLogger("symlinks")
+    logger.setLevel(level)
+    logger.propagate = False
+
+    handler = logging.FileHandler(get_log_file_path(), encoding="utf-8", delay=True)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(handler)
+
+    return logger
+
+
+logger = setup_logging()
 
 
 def log_message(msg: str) -> None:
@@ -73,9 +103,7 @@ def log_message(msg: str) -> None:
     Args:
         msg: The message to append to the log file
     """
-    log_file = get_log_file_path()
-    with open(log_file, "a", encoding="utf-8") as logf:
-        logf.write(f"{msg}\n")
+    logger.info(msg)
 
 
 def create_symlinks_for_common_voice(common_voice_dir: str, destination_dir: str) -> None:
@@ -117,38 +145,75 @@ def create_symlinks_for_common_voice(common_voice_dir: str, destination_dir: str
         log_message(msg)
         return
 
-    with open(tsv_file, "r", encoding="utf-8") as f:
-        try:
-            reader = csv.DictReader(f, delimiter="\t")
-            # Enumerate lines, starting after the header = line 2
-            for line_idx, row in enumerate(reader, start=2):
-                if "path" not in row:
-                    continue
-
-                mp3_filename = row["path"]
-                wav_filename = mp3_filename.replace(
-                    ".mp3", ".wav"
-                )  # The original files and thus those in the CSV are .mp3
-                wav_file_path = clips_folder / wav_filename
-
-                if wav_file_path.exists():
-                    symlink_path = destination / wav_filename
-                    if symlink_path.exists() or symlink_path.is_symlink():
-                        symlink_path.unlink()
-                    os.symlink(wav_file_path, symlink_path)
-                else:
-                    warning_msg = f"Warning: {wav_file_path} does not exist."
-                    print(warning_msg)
-                    log_message(warning_msg)
-
-        except csv.Error as e:
-            error_str = (
-                f"CSV error on line {line_idx} of '{tsv_file}': {e}\n"
-                f"You may want to inspect this line in a text editor, or use a manual parse."
-            )
-            print(error_str)
-            log_message(error_str)
-            return
+    # Work with plain strings in the row loop; validated.tsv can have millions of rows
+    clips_str = str(clips_folder)
+
+    # Resolve the clips and destination directories once and look up each row
+    # relative to them, rather than walking the full path for every file
+    clips_fd = os.open(clips_str, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        dest_fd = os.open(str(destination), os.O_RDONLY | os.O_DIRECTORY)
+    except OSError:
+        os.close(clips_fd)
+        raise
+
+    try:
+        with open(tsv_file, "r", encoding="utf-8") as f:
+            line_idx = 1
+            try:
+                reader = csv.reader(f, delimiter="\t")
+                header = next(reader, [])
+                if "path" not in header:
+                    msg = f"No 'path' column found in '{tsv_file}'. Skipping..."
+                    print(msg)
+                    log_message(msg)
+                    return
+                path_idx = header.index("path")
+
+                # Enumerate lines, starting after the header = line 2
+                for line_idx, row in enumerate(reader, start=2):
+                    if len(row) <= path_idx:
+                        continue
+
+                    mp3_filename = row[path_idx]
+                    # The original files and thus those in the CSV are .mp3
+                    if mp3_filename.endswith(".mp3"):
+                        wav_filename = mp3_filename[:-4] + ".wav"
+                    else:
+                        wav_filename = mp3_filename
+                    wav_file_path = os.path.join(clips_str, wav_filename)
+
+                    try:
+                        os.stat(wav_filename, dir_fd=clips_fd)
+                    except (FileNotFoundError, NotADirectoryError):
+                        warning_msg = f"Warning: {wav_file_path} does not exist."
+                        print(warning_msg)
+                        log_message(warning_msg)
+                        continue
+                    except OSError as e:
+                        warning_msg = f"Warning: could not access {wav_file_path}: {e}"
+                        print(warning_msg)
+                        log_message(warning_msg)
+                        continue
+
+                    # Destinations are usually empty, so only replace a link on collision
+                    try:
+                        os.symlink(wav_file_path, wav_filename, dir_fd=dest_fd)
+                    except FileExistsError:
+                        os.unlink(wav_filename, dir_fd=dest_fd)
+                        os.symlink(wav_file_path, wav_filename, dir_fd=dest_fd)
+
+            except csv.Error as e:
+                error_str = (
+                    f"CSV error on line {line_idx} of '{tsv_file}': {e}\n"
+                    f"You may want to inspect this line in a text editor, or use a manual parse."
+                )
+                print(error_str)
+                log_message(error_str)
+                return
+    finally:
+        os.close(clips_fd)
+        os.close(dest_fd)
 
     complete_msg = f"Symlinks created for dataset in {common_voice_path}."
     print(complete_msg)
@@ -170,7 +235,7 @@ def create_symlinks_for_all_common_voice(top_level_dir: str, destination_root: s
     dest_root.mkdir(parents=True, exist_ok=True)
 
     # Find every validated.tsv in the subfolders
-    for tsv_file in top_dir.rglob("validated.tsv"):
+    for tsv_file in find_validated_tsvs(top_dir):
         dataset_dir = tsv_file.parent
         # Use the dataset directory name (parent folder) to name the destination subfolder
         language_subfolder = dataset_dir.name